@@ -83,8 +83,8 @@ import sys
 import threading
 from functools import wraps
 from typing import (Any, Awaitable, Callable, Dict, Generic, Hashable,
-                    Optional, Type, TypeVar, Union, cast, get_type_hints,
-                    overload)
+                    Optional, Tuple, Type, TypeVar, Union, cast,
+                    get_type_hints, overload)
 
 _HAS_PEP604_SUPPORT = sys.version_info[:3] >= (3, 10, 0)  # PEP 604
 if _HAS_PEP604_SUPPORT:
@@ -105,8 +105,12 @@ else:
 logger = logging.getLogger('inject')
 
 _INJECTOR = None  # Shared injector instance.
-_INJECTOR_LOCK = threading.RLock()  # Guards injector initialization.
-_BINDING_LOCK = threading.RLock()  # Guards runtime bindings.
+_INJECTOR_LOCK = threading.RLock()  # Guards injector initialization, reentrant as configs may call clear().
+
+# Context manager types checked on every injection, aliased to skip the contextlib attribute lookups.
+_GeneratorContextManager = contextlib._GeneratorContextManager
+_AsyncGeneratorContextManager = contextlib._AsyncGeneratorContextManager
+_CONTEXT_MANAGER_TYPES = (_GeneratorContextManager, _AsyncGeneratorContextManager)
 
 Injectable = Union[object, Any]
 T = TypeVar('T', bound=Injectable)
@@ -135,24 +139,22 @@ class Binder(object):
 
     def bind(self, cls: Binding, instance: T) -> 'Binder':
         """Bind a class to an instance."""
-        self._check_class(cls)
+        keys = self._check_class(cls)
 
         b = lambda: instance
-        self._bindings[cls] = b
-        self._maybe_bind_forward(cls, b)
+        self._bind(keys, b)
 
         logger.debug('Bound %s to an instance %s', cls, instance)
         return self
 
     def bind_to_constructor(self, cls: Binding, constructor: Constructor) -> 'Binder':
         """Bind a class to a callable singleton constructor."""
-        self._check_class(cls)
+        keys = self._check_class(cls)
         if constructor is None:
             raise InjectorException('Constructor cannot be None, key=%s' % cls)
         
-        b = _ConstructorBinding(constructor)
-        self._bindings[cls] = b
-        self._maybe_bind_forward(cls, b)
+        b = _ConstructorBinding(constructor, self._bindings, keys)
+        self._bind(keys, b)
 
         logger.debug('Bound %s to a constructor %s', cls, constructor)
         return self
@@ -162,42 +164,40 @@ class Binder(object):
         Bind a class to a callable instance provider executed for each injection.
         A provider can be a normal function or a context manager. Both sync and async are supported.
         """
-        self._check_class(cls)
+        keys = self._check_class(cls)
         if provider is None:
             raise InjectorException('Provider cannot be None, key=%s' % cls)
 
         b = provider
-        self._bindings[cls] = b
-        self._maybe_bind_forward(cls, b)
+        self._bind(keys, b)
 
         logger.debug('Bound %s to a provider %s', cls, provider)
         return self
 
-    def _check_class(self, cls: Binding) -> None:
+    def _check_class(self, cls: Binding) -> Tuple[Binding, ...]:
+        """Check a binding key, return it and its forward reference for a string key."""
         if cls is None:
             raise InjectorException('Binding key cannot be None')
 
-        if not self.allow_override and cls in self._bindings:
+        keys = (cls, ForwardRef(cls)) if _HAS_PEP560_SUPPORT and isinstance(cls, str) else (cls,)
+        if self.allow_override:
+            return keys
+
+        bindings = self._bindings
+        if cls in bindings:
             raise InjectorException('Duplicate binding, key=%s' % cls)
 
-        if self._is_forward_str(cls):
-            ref = ForwardRef(cls)
-            if ref in self._bindings:
-                raise InjectorException('Duplicate forward binding, i.e. "int" and int, key=%s', cls)
-    
-    def _maybe_bind_forward(self, cls: Binding, binding: Any) -> None:
-        """Bind a string forward reference."""
-        if not _HAS_PEP560_SUPPORT:
-            return
-        if not isinstance(cls, str):
-            return
-        
-        ref = ForwardRef(cls)
-        self._bindings[ref] = binding
-        logger.debug('Bound forward ref "%s"', cls)
+        if len(keys) == 2 and keys[1] in bindings:
+            raise InjectorException('Duplicate forward binding, i.e. "int" and int, key=%s' % cls)
+        return keys
 
-    def _is_forward_str(self, cls: Binding) -> bool:
-        return _HAS_PEP560_SUPPORT and isinstance(cls, str)
+    def _bind(self, keys: Tuple[Binding, ...], binding: Any) -> None:
+        """Bind a key and its string forward reference."""
+        for key in keys:
+            self._bindings[key] = binding
+
+        if len(keys) == 2:
+            logger.debug('Bound forward ref "%s"', keys[0])
 
 
 class Injector(object):
@@ -222,169 +222,324 @@ class Injector(object):
 
     def get_instance(self, cls: Binding) -> Injectable:
         """Return an instance for a class."""
-        binding = self._bindings.get(cls)
-        if binding:
+        bindings = self._bindings
+        binding: Optional[Constructor]
+        try:
+            binding = bindings[cls]
+        except KeyError:
+            pass
+        else:
+            # Called outside the try, a KeyError raised by a provider must not look like a missing binding.
             return binding()
 
         # Try to create a runtime binding.
-        with _BINDING_LOCK:
-            binding = self._bindings.get(cls)
-            if binding:
-                return binding()
+        if not self._bind_in_runtime:
+            raise InjectorException(
+                'No binding was found for key=%s' % cls)
 
-            if not self._bind_in_runtime:
-                raise InjectorException(
-                    'No binding was found for key=%s' % cls)
+        if not callable(cls):
+            raise InjectorException(
+                'Cannot create a runtime binding, the key is not callable, key=%s' % cls)
 
-            if not callable(cls):
-                raise InjectorException(
-                    'Cannot create a runtime binding, the key is not callable, key=%s' % cls)
+        # One lock per key, so creating one runtime binding does not block the others.
+        key = (self, cls)
+        while True:
+            binding = bindings.get(cls)
+            if binding is not None:
+                return binding()
 
-            try:
-                instance = cls()
-            except TypeError as previous_error:
-                raise ConstructorTypeError(cls, previous_error)
+            key_lock = _CREATION_LOCKS.acquire(key, cls)
+            if key_lock is not None:
+                break
 
-            self._bindings[cls] = lambda: instance
+        try:
+            # Another thread may have created the binding before the lock was acquired.
+            binding = bindings.get(cls)
+            if binding is None:
+                try:
+                    instance = cls()
+                except TypeError as previous_error:
+                    raise ConstructorTypeError(cls, previous_error)
 
-            logger.debug(
-                'Created a runtime binding for key=%s, instance=%s', cls, instance)
-            return instance
+                binding = bindings[cls] = lambda: instance
+                logger.debug(
+                    'Created a runtime binding for key=%s, instance=%s', cls, instance)
+        finally:
+            _CREATION_LOCKS.release(key, key_lock)
+
+        return binding()
 
 
 class InjectorException(Exception):
     pass
 
 
+class _CreationLocks(object):
+    """Per-key locks to create instances once, circular dependencies between threads raise instead of deadlocking."""
+    __slots__ = ('_lock', '_owners', '_waiting')
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()  # Guards the dicts, never held while creating an instance.
+        self._owners: Dict[Hashable, Tuple[threading.RLock, int]] = {}  # Key to its lock and owner thread.
+        self._waiting: Dict[int, Hashable] = {}  # Thread to the key it waits for.
+
+    def acquire(self, key: Hashable, name: Any) -> Optional[threading.RLock]:
+        """Return an acquired lock for a key, or None after waiting for another thread to release it."""
+        thread_id = threading.get_ident()
+        with self._lock:
+            owned = self._owners.get(key)
+            if owned is None:
+                key_lock = threading.RLock()
+                key_lock.acquire()
+                self._owners[key] = (key_lock, thread_id)
+                return key_lock
+
+            key_lock, owner = owned
+            if self._waits_for(owner, thread_id):
+                raise InjectorException('Circular dependency, key=%s' % name)
+            self._waiting[thread_id] = key
+
+        try:
+            with key_lock:
+                pass
+        finally:
+            # Always removed, a stale wait edge would report false circular dependencies.
+            with self._lock:
+                del self._waiting[thread_id]
+        return None
+
+    def release(self, key: Hashable, key_lock: threading.RLock) -> None:
+        """Release a lock returned by acquire."""
+        with self._lock:
+            del self._owners[key]
+        key_lock.release()
+
+    def _waits_for(self, thread_id: int, other_id: int) -> bool:
+        """Return true if a thread is another thread or waits for it, directly or not."""
+        while thread_id != other_id:
+            key = self._waiting.get(thread_id)
+            if key is None:
+                return False
+
+            owned = self._owners.get(key)
+            if owned is None:
+                return False
+            thread_id = owned[1]
+        return True
+
+
+_CREATION_LOCKS = _CreationLocks()  # Shared, so cycles across injectors and binding kinds are detected too.
+
+
 class _ConstructorBinding(Generic[T]):
+    __slots__ = ('_constructor', '_instance', '_bindings', '_keys')
     _instance: Optional[T]
 
-    def __init__(self, constructor: Callable[[], T]) -> None:
+    def __init__(
+        self,
+        constructor: Callable[[], T],
+        bindings: Optional[Dict[Binding, Constructor]] = None,
+        keys: Tuple[Binding, ...] = (),
+    ) -> None:
         self._constructor = constructor
-        self._created = False
         self._instance = None
+        self._bindings = bindings
+        self._keys = keys
 
     def __call__(self) -> T:
-        if self._created and self._instance is not None:
-            return self._instance
+        # Single attribute load on the hot path, the instance is only set once it is created.
+        instance = self._instance
+        if instance is not None:
+            return instance
+
+        # One lock per binding, so constructing one singleton does not block the others.
+        while True:
+            key_lock = _CREATION_LOCKS.acquire(self, self._constructor)
+            if key_lock is not None:
+                break
+
+            instance = self._instance
+            if instance is not None:
+                return instance
+
+        try:
+            instance = self._instance
+            if instance is None:
+                instance = self._instance = self._constructor()
+                if instance is not None:
+                    self._replace_with_instance(instance)
+        finally:
+            _CREATION_LOCKS.release(self, key_lock)
+        return instance
+
+    def _replace_with_instance(self, instance: T) -> None:
+        """Replace this binding with an instance binding, so next injections skip the singleton check."""
+        bindings = self._bindings
+        if bindings is None:
+            return
+
+        self._bindings = None
+        b = lambda: instance
+        for key in self._keys:
+            # The key may have been rebound since, only replace this binding.
+            if bindings.get(key) is self:
+                bindings[key] = b
 
-        with _BINDING_LOCK:
-            if self._created and self._instance is not None:
-                return self._instance
-            self._instance = self._constructor()
-            self._created = True
-        return self._instance
 
+class _CachedAttributeInjection(object):
+    """Base attribute injection, optionally caches injected values in the instance __dict__."""
+    __slots__ = ('_cls', '_cache', '_name')
 
-class _AttributeInjection(object):
-    def __init__(self, cls: Binding) -> None:
+    def __init__(self, cls: Binding, cache: bool = False) -> None:
         self._cls = cls
+        self._cache = cache
+        self._name: Optional[str] = None
+
+    def __set_name__(self, owner: Any, name: str) -> None:
+        if self._name is None:
+            self._name = name
+        elif name != self._name:
+            raise TypeError(
+                'Cannot assign the same attribute injection to two different names (%r and %r).' % (self._name, name))
+
+    def _maybe_cache(self, obj: Any, inst: Injectable) -> None:
+        if not self._cache or obj is None:
+            return
+
+        if self._name is None:
+            raise TypeError('Cannot cache an attribute injection without calling __set_name__ on it.')
+
+        # This is a non-data descriptor, so the instance __dict__ takes precedence on the next access.
+        obj_dict = getattr(obj, '__dict__', None)
+        if obj_dict is not None:
+            obj_dict[self._name] = inst
+
+
+class _AttributeInjection(_CachedAttributeInjection):
+    __slots__ = ()
 
     def __get__(self, obj: Any, owner: Any) -> Injectable:
-        inst = instance(self._cls)
-        if isinstance(inst, contextlib._AsyncGeneratorContextManager):
+        inst = get_injector_or_die().get_instance(self._cls)
+        if isinstance(inst, _AsyncGeneratorContextManager):
             raise InjectorException(
                     'Fail to load _AsyncGeneratorContextManager, use autoparams, param or params instead of attr function')
-        elif isinstance(inst, contextlib._GeneratorContextManager):
+        elif isinstance(inst, _GeneratorContextManager):
             with contextlib.ExitStack() as sync_stack:
                 inst = sync_stack.enter_context(inst)
+
+        self._maybe_cache(obj, inst)
         return inst
 
 
-class _AttributeInjectionDataclass(Generic[T]):
-    def __init__(self, cls: Binding) -> None:
-        self._cls = cls
+class _AttributeInjectionDataclass(_CachedAttributeInjection, Generic[T]):
+    __slots__ = ()
 
     def __get__(self, instance, owner) -> T:
         injector = get_injector()
-        if injector is not None:
-            return injector.get_instance(self._cls)
-        raise AttributeError
+        if injector is None:
+            raise AttributeError
+
+        inst = injector.get_instance(self._cls)
+        self._maybe_cache(instance, inst)
+        return inst
 
 
 class _ParameterInjection(Generic[T]):
-    __slots__ = ('_name', '_cls')
+    __slots__ = ('_name', '_key')
 
     def __init__(self, name: str, cls: Optional[Binding] = None) -> None:
         self._name = name
-        self._cls = cls
+        self._key = cls if cls is not None else name
 
     def __call__(self, func: Callable[..., Union[T, Awaitable[T]]]) -> Callable[..., Union[T, Awaitable[T]]]:
+        name = self._name
+        key = self._key
+
         if inspect.iscoroutinefunction(func):
             @wraps(func)
             async def async_injection_wrapper(*args: Any, **kwargs: Any) -> T:
-                if self._name not in kwargs:
-                    kwargs[self._name] = instance(self._cls or self._name)
+                if name not in kwargs:
+                    kwargs[name] = get_injector_or_die().get_instance(key)
                 async_func = cast(Callable[..., Awaitable[T]], func)
                 return await async_func(*args, **kwargs)
             return async_injection_wrapper
         
         @wraps(func)
         def injection_wrapper(*args: Any, **kwargs: Any) -> T:
-            if self._name not in kwargs:
-                kwargs[self._name] = instance(self._cls or self._name)
+            if name not in kwargs:
+                kwargs[name] = get_injector_or_die().get_instance(key)
             sync_func = cast(Callable[..., T], func)
             return sync_func(*args, **kwargs)
 
         return injection_wrapper
 
 
+def _aggregate_sync_stack(
+        sync_stack: contextlib.ExitStack,
+        injected_params: list[str],
+        kwargs: dict[str, Any]
+) -> None:
+    """Extracts context managers, aggregate them in an ExitStack and swap out the param value with results of
+    running __enter__(). The result is equivalent to using `with` multiple times """
+    executed_kwargs = {
+        param: sync_stack.enter_context(kwargs[param])
+        for param in injected_params
+        if isinstance(kwargs[param], _GeneratorContextManager)
+    }
+    kwargs.update(executed_kwargs)
+
+
+async def _aggregate_async_stack(
+        async_stack: contextlib.AsyncExitStack,
+        injected_params: list[str],
+        kwargs: dict[str, Any]
+) -> None:
+    """Similar to _aggregate_sync_stack, but for async context managers"""
+    executed_kwargs = {
+        param: await async_stack.enter_async_context(kwargs[param])
+        for param in injected_params
+        if isinstance(kwargs[param], _AsyncGeneratorContextManager)
+    }
+    kwargs.update(executed_kwargs)
+
+
 class _ParametersInjection(Generic[T]):
     __slots__ = ('_params', )
 
     def __init__(self, **kwargs: Any) -> None:
         self._params = kwargs
 
-    @staticmethod
-    def _aggregate_sync_stack(
-            sync_stack: contextlib.ExitStack,
-            provided_params: frozenset[str],
-            kwargs: dict[str, Any]
-    ) -> None:
-        """Extracts context managers, aggregate them in an ExitStack and swap out the param value with results of
-        running __enter__(). The result is equivalent to using `with` multiple times """
-        executed_kwargs = {
-            param: sync_stack.enter_context(inst)
-            for param, inst in kwargs.items()
-            if param not in provided_params and isinstance(inst, contextlib._GeneratorContextManager)
-        }
-        kwargs.update(executed_kwargs)
-
-    @staticmethod
-    async def _aggregate_async_stack(
-            async_stack: contextlib.AsyncExitStack,
-            provided_params: frozenset[str],
-            kwargs: dict[str, Any]
-    ) -> None:
-        """Similar to _aggregate_sync_stack, but for async context managers"""
-        executed_kwargs = {
-            param: await async_stack.enter_async_context(inst)
-            for param, inst in kwargs.items()
-            if param not in provided_params and isinstance(inst, contextlib._AsyncGeneratorContextManager)
-        }
-        kwargs.update(executed_kwargs)
-
     def __call__(self, func: Callable[..., Union[Awaitable[T], T]]) -> Callable[..., Union[Awaitable[T], T]]:
-        if sys.version_info.major == 2:
-            arg_names = inspect.getargspec(func).args
-        else:
-            arg_names = inspect.getfullargspec(func).args
-        params_to_provide = self._params
+        arg_names = inspect.getfullargspec(func).args
+
+        # Resolve argument positions once, a param is provided positionally when its position < len(args).
+        arg_positions = {name: position for position, name in enumerate(arg_names)}
+        params_to_provide = tuple(
+            (param, cls, arg_positions.get(param, sys.maxsize)) for param, cls in self._params.items()
+        )
 
         if inspect.iscoroutinefunction(func):
             @wraps(func)
             async def async_injection_wrapper(*args: Any, **kwargs: Any) -> T:
-                provided_params = frozenset(
-                    arg_names[:len(args)]) | frozenset(kwargs.keys())
-                for param, cls in params_to_provide.items():
-                    if param not in provided_params:
-                        kwargs[param] = instance(cls)
+                nargs = len(args)
+                context_params = []
+                get_instance = None
+                for param, cls, position in params_to_provide:
+                    if position >= nargs and param not in kwargs:
+                        if get_instance is None:
+                            get_instance = get_injector_or_die().get_instance
+                        inst = kwargs[param] = get_instance(cls)
+                        if isinstance(inst, _CONTEXT_MANAGER_TYPES):
+                            context_params.append(param)
                 async_func = cast(Callable[..., Awaitable[T]], func)
                 try:
+                    if not context_params:
+                        return await async_func(*args, **kwargs)
+
                     with contextlib.ExitStack() as sync_stack:
                         async with contextlib.AsyncExitStack() as async_stack:
-                            self._aggregate_sync_stack(sync_stack, provided_params, kwargs)
-                            await self._aggregate_async_stack(async_stack, provided_params, kwargs)
+                            _aggregate_sync_stack(sync_stack, context_params, kwargs)
+                            await _aggregate_async_stack(async_stack, context_params, kwargs)
                             return await async_func(*args, **kwargs)
                 except TypeError as previous_error:
                     raise ConstructorTypeError(func, previous_error)
@@ -393,15 +548,23 @@ class _ParametersInjection(Generic[T]):
 
         @wraps(func)
         def injection_wrapper(*args: Any, **kwargs: Any) -> T:
-            provided_params = frozenset(
-                arg_names[:len(args)]) | frozenset(kwargs.keys())
-            for param, cls in params_to_provide.items():
-                if param not in provided_params:
-                    kwargs[param] = instance(cls)
+            nargs = len(args)
+            context_params = []
+            get_instance = None
+            for param, cls, position in params_to_provide:
+                if position >= nargs and param not in kwargs:
+                    if get_instance is None:
+                        get_instance = get_injector_or_die().get_instance
+                    inst = kwargs[param] = get_instance(cls)
+                    if isinstance(inst, _GeneratorContextManager):
+                        context_params.append(param)
             sync_func = cast(Callable[..., T], func)
             try:
+                if not context_params:
+                    return sync_func(*args, **kwargs)
+
                 with contextlib.ExitStack() as sync_stack:
-                    self._aggregate_sync_stack(sync_stack, provided_params, kwargs)
+                    _aggregate_sync_stack(sync_stack, context_params, kwargs)
                     return sync_func(*args, **kwargs)
             except TypeError as previous_error:
                 raise ConstructorTypeError(func, previous_error)
@@ -422,7 +585,7 @@ def configure(
         raise InjectorException('clear and once are mutually exclusive, only one can be True')
 
     with _INJECTOR_LOCK:
-        if _INJECTOR:
+        if _INJECTOR is not None:
             if clear:
                 _clear_injector()
             elif once:
@@ -444,11 +607,7 @@ def configure_once(
     
     Deprecated, use `configure(once=True)` instead.
     """
-    with _INJECTOR_LOCK:
-        if _INJECTOR:
-            return _INJECTOR
-
-        return configure(config, bind_in_runtime=bind_in_runtime, allow_override=allow_override)
+    return configure(config, bind_in_runtime=bind_in_runtime, allow_override=allow_override, once=True)
 
 
 def clear_and_configure(
@@ -460,32 +619,29 @@ def clear_and_configure(
     
     Deprecated, use configure(clear=True) instead.
     """
-    with _INJECTOR_LOCK:
-        _clear_injector()
-        return configure(config, bind_in_runtime=bind_in_runtime, allow_override=allow_override)
+    return configure(config, bind_in_runtime=bind_in_runtime, allow_override=allow_override, clear=True)
 
 
 def is_configured() -> bool:
     """Return true if an injector is already configured."""
-    with _INJECTOR_LOCK:
-        return _INJECTOR is not None
+    return _INJECTOR is not None
 
 
 def clear() -> None:
     """Clear an existing injector if present."""
-    _clear_injector()
+    with _INJECTOR_LOCK:
+        _clear_injector()
 
 
 def _clear_injector() -> None:
-    """Clear an existing injector if present."""
+    """Clear an existing injector if present, must be called with _INJECTOR_LOCK held."""
     global _INJECTOR
 
-    with _INJECTOR_LOCK:
-        if _INJECTOR is None:
-            return
+    if _INJECTOR is None:
+        return
 
-        _INJECTOR = None
-        logger.debug('Cleared an injector')
+    _INJECTOR = None
+    logger.debug('Cleared an injector')
 
 
 @overload
@@ -499,24 +655,29 @@ def instance(cls: Binding) -> Injectable:
     return get_injector_or_die().get_instance(cls)
 
 @overload
-def attr(cls: Type[T]) -> T: ...
+def attr(cls: Type[T], cache: bool = False) -> T: ...
 
 @overload
-def attr(cls: Hashable) -> Injectable: ...
+def attr(cls: Hashable, cache: bool = False) -> Injectable: ...
 
-def attr(cls: Binding) -> Injectable:
-    """Return a attribute injection (descriptor)."""
-    return _AttributeInjection(cls)
+def attr(cls: Binding, cache: bool = False) -> Injectable:
+    """Return a attribute injection (descriptor).
+
+    When `cache` is true, the injected value is stored in the instance `__dict__` on first access,
+    and subsequent accesses skip the injector. Class-level accesses are never cached. A caching
+    descriptor must be assigned in a class body, under a single name.
+    """
+    return _AttributeInjection(cls, cache)
 
 @overload
-def attr_dc(cls: Type[T]) -> T: ...
+def attr_dc(cls: Type[T], cache: bool = False) -> T: ...
 
 @overload
-def attr_dc(cls: Hashable) -> Injectable: ...
+def attr_dc(cls: Hashable, cache: bool = False) -> Injectable: ...
 
-def attr_dc(cls: Binding) -> Injectable:
-    """Return a attribute injection (descriptor)."""
-    return _AttributeInjectionDataclass(cls)
+def attr_dc(cls: Binding, cache: bool = False) -> Injectable:
+    """Return a attribute injection (descriptor), see `attr` for `cache`."""
+    return _AttributeInjectionDataclass(cls, cache)
 
 
 def param(name: str, cls: Optional[Binding] = None) -> Callable:
@@ -583,7 +744,7 @@ def get_injector() -> Optional[Injector]:
 def get_injector_or_die() -> Injector:
     """Return the current injector or raise an InjectorException."""
     injector = _INJECTOR
-    if not injector:
+    if injector is None:
         raise InjectorException('No injector is configured')
 
     return injector
@@ -591,6 +752,9 @@ def get_injector_or_die() -> Injector:
 
 def _unwrap_union_arg(typ):
     """Return the first type A in typing.Union[A, B] or typ if not Union."""
+    if isinstance(typ, type):
+        # Fast path for the common case, plain classes are never unions.
+        return typ
     if not _is_union_type(typ):
         return typ
     return typ.__args__[0]
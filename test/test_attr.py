@@ -26,6 +26,66 @@ class TestInjectAttr(BaseTestInject):
         assert value0 == 123
         assert value1 == 123
 
+    def test_attr_cache(self):
+        class MyClass(object):
+            field = inject.attr(int, cache=True)
+
+        calls = []
+        inject.configure(lambda binder: binder.bind_to_provider(int, lambda: calls.append(1) or len(calls)))
+        my0 = MyClass()
+        my1 = MyClass()
+
+        assert my0.field == 1
+        assert my0.field == 1
+        assert my1.field == 2
+        assert MyClass.field == 3
+        assert MyClass.field == 4
+        assert 'field' in my0.__dict__
+
+    def test_attr_no_cache(self):
+        class MyClass(object):
+            field = inject.attr(int)
+
+        calls = []
+        inject.configure(lambda binder: binder.bind_to_provider(int, lambda: calls.append(1) or len(calls)))
+        my = MyClass()
+
+        assert my.field == 1
+        assert my.field == 2
+        assert 'field' not in my.__dict__
+
+    def test_attr_cache_slots(self):
+        class MyClass(object):
+            __slots__ = ()
+            field = inject.attr(int, cache=True)
+
+        inject.configure(lambda binder: binder.bind(int, 123))
+        my = MyClass()
+
+        assert my.field == 123
+        assert my.field == 123
+
+    def test_attr_cache_shared_between_names(self):
+        shared = inject.attr(int, cache=True)
+
+        class MyClass(object):
+            field = shared
+
+        # Python < 3.12 wraps errors raised in __set_name__ in a RuntimeError.
+        with self.assertRaises((RuntimeError, TypeError)):
+            class MyClass2(object):
+                other = shared
+
+    def test_attr_cache_without_set_name(self):
+        class MyClass(object):
+            pass
+
+        MyClass.field = inject.attr(int, cache=True)
+        inject.configure(lambda binder: binder.bind(int, 123))
+
+        assert MyClass.field == 123
+        self.assertRaises(TypeError, getattr, MyClass(), 'field')
+
 
 class TestInjectAttrDataclass(BaseTestInject):
     def test_class_attr_dc(self):
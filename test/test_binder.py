@@ -1,3 +1,4 @@
+from typing import ForwardRef
 from unittest import TestCase
 
 from inject import Binder, InjectorException
@@ -27,6 +28,18 @@ class TestBinder(TestCase):
         binder.bind(int, 456)
         assert int in binder._bindings
 
+    def test_bind__allow_override_forward_str(self):
+        binder = Binder(allow_override=True)
+        binder.bind('key', 123)
+        binder.bind('key', 456)
+        assert binder._bindings['key']() == 456
+
+    def test_bind__duplicate_forward_binding(self):
+        binder = Binder()
+        binder.bind(ForwardRef('key'), 123)
+
+        self.assertRaisesRegex(InjectorException, 'Duplicate forward binding.*key=key', binder.bind, 'key', 456)
+
     def test_bind_provider(self):
         provider = lambda: 123
         binder = Binder()
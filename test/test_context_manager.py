@@ -104,4 +104,18 @@ class TestContextManagerFunctional(BaseTestInject):
         f_, conn_, foo_ = self.run_async(mock_func())
         assert not f_.started
         assert not conn_.started
-        assert not foo_.started
\ No newline at end of file
+        assert not foo_.started
+
+    def test_provided_context_manager_is_not_entered(self):
+        def config(binder):
+            binder.bind_to_provider(MockFile, get_file_sync)
+
+        inject.configure(config)
+
+        @inject.autoparams()
+        def mock_func(f: MockFile):
+            return f
+
+        cm = get_file_sync()
+        assert mock_func(cm) is cm
+        assert mock_func(f=cm) is cm
@@ -36,3 +36,30 @@ class TestInjectAttrDataclass(BaseTestInject):
 
         assert MyClass().field == 123
         assert MyClass.field == 123
+
+    def test_attr_dc_cache(self):
+        @dataclass
+        class MyClass:
+            field: ClassVar[int] = inject.attr_dc(int, cache=True)
+
+        calls = []
+        inject.configure(lambda binder: binder.bind_to_provider(int, lambda: calls.append(1) or len(calls)))
+        my = MyClass()
+
+        assert my.field == 1
+        assert my.field == 1
+        assert MyClass().field == 2
+        assert MyClass.field == 3
+
+    def test_attr_dc_cache_shared_between_names(self):
+        shared = inject.attr_dc(int, cache=True)
+
+        @dataclass
+        class MyClass:
+            field: ClassVar[int] = shared
+
+        # Python < 3.12 wraps errors raised in __set_name__ in a RuntimeError.
+        with self.assertRaises((RuntimeError, TypeError)):
+            @dataclass
+            class MyClass2:
+                other: ClassVar[int] = shared
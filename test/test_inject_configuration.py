@@ -20,6 +20,15 @@ class TestInjectConfiguration(BaseTestInject):
 
         self.assertRaisesRegex(InjectorException, 'Injector is already configured', inject.configure)
 
+    def test_configure__config_calls_clear(self):
+        def config(binder):
+            inject.clear()
+            binder.bind(int, 123)
+
+        injector = inject.configure(config)
+        assert inject.get_injector() is injector
+        assert injector.get_instance(int) == 123
+
     def test_configure_once__should_create_injector(self):
         injector = inject.configure_once()
         assert inject.get_injector() is injector
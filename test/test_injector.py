@@ -1,7 +1,10 @@
+import threading
+import weakref
 from random import random
-from unittest import TestCase
+from typing import ForwardRef
+from unittest import TestCase, mock
 
-from inject import Injector, InjectorException
+from inject import _CREATION_LOCKS, Injector, InjectorException, _ConstructorBinding
 
 
 class TestInjector(TestCase):
@@ -17,12 +20,87 @@ class TestInjector(TestCase):
 
         assert instance0 == instance1
 
+    def test_constructor_binding__should_replace_itself_with_instance(self):
+        injector = Injector(lambda binder: binder.bind_to_constructor('key', random))
+        instance0 = injector.get_instance('key')
+        instance1 = injector.get_instance(ForwardRef('key'))
+
+        assert instance0 == instance1
+        assert not isinstance(injector._bindings['key'], _ConstructorBinding)
+        assert not isinstance(injector._bindings[ForwardRef('key')], _ConstructorBinding)
+        assert injector.get_instance('key') == instance0
+
+    def test_constructor_binding__should_replace_only_its_keys(self):
+        def config(binder):
+            binder.bind_to_constructor('key', random)
+            binder.bind_to_constructor('other', random)
+
+        injector = Injector(config)
+        other = injector._bindings['other']
+        injector.get_instance('key')
+
+        assert not isinstance(injector._bindings['key'], _ConstructorBinding)
+        assert not isinstance(injector._bindings[ForwardRef('key')], _ConstructorBinding)
+        assert injector._bindings['other'] is other
+        assert injector._bindings[ForwardRef('other')] is other
+
+    def test_constructor_binding__concurrent_keys(self):
+        started = threading.Event()
+        released = threading.Event()
+
+        def slow():
+            started.set()
+            return released.wait(1)
+
+        def config(binder):
+            binder.bind_to_constructor('slow', slow)
+            binder.bind_to_constructor('fast', object)
+
+        injector = Injector(config)
+        thread = threading.Thread(target=injector.get_instance, args=('slow',))
+        thread.start()
+        started.wait(1)
+
+        # Must not wait for the slow constructor.
+        injector.get_instance('fast')
+        released.set()
+        thread.join()
+
+        assert injector.get_instance('slow') is True
+
+    def test_constructor_binding__circular(self):
+        class MyClass(object):
+            def __init__(self):
+                injector.get_instance('key')
+
+        injector = Injector(lambda binder: binder.bind_to_constructor('key', MyClass))
+        self.assertRaisesRegex(InjectorException, 'Circular dependency', injector.get_instance, 'key')
+        assert not _CREATION_LOCKS._owners
+
     def test_provider_binding__should_call_provider_for_each_injection(self):
         injector = Injector(lambda binder: binder.bind_to_provider(int, random))
         instance0 = injector.get_instance(int)
         instance1 = injector.get_instance(int)
         assert instance0 != instance1
 
+    def test_provider_binding__falsy_provider(self):
+        class Provider(object):
+            def __bool__(self):
+                return False
+
+            def __call__(self):
+                return 123
+
+        injector = Injector(lambda binder: binder.bind_to_provider(int, Provider()), bind_in_runtime=False)
+        assert injector.get_instance(int) == 123
+
+    def test_provider_binding__provider_key_error(self):
+        def provider():
+            return {}['missing']
+
+        injector = Injector(lambda binder: binder.bind_to_provider(int, provider))
+        self.assertRaises(KeyError, injector.get_instance, int)
+
 
     def test_runtime_binding__should_create_runtime_singleton(self):
         class MyClass(object):
@@ -35,6 +113,100 @@ class TestInjector(TestCase):
         assert instance0 is instance1
         assert isinstance(instance0, MyClass)
 
+    def test_runtime_binding__nested(self):
+        class Dependency(object):
+            pass
+
+        class MyClass(object):
+            def __init__(self):
+                self.dependency = injector.get_instance(Dependency)
+
+        injector = Injector()
+        instance = injector.get_instance(MyClass)
+
+        assert instance.dependency is injector.get_instance(Dependency)
+
+    def test_runtime_binding__concurrent_keys(self):
+        started = threading.Event()
+        released = threading.Event()
+
+        class Slow(object):
+            def __init__(self):
+                started.set()
+                self.released = released.wait(1)
+
+        class Fast(object):
+            pass
+
+        injector = Injector()
+        thread = threading.Thread(target=injector.get_instance, args=(Slow,))
+        thread.start()
+        started.wait(1)
+
+        # Must not wait for Slow to be constructed.
+        injector.get_instance(Fast)
+        released.set()
+        thread.join()
+
+        assert injector.get_instance(Slow).released
+
+    def test_runtime_binding__constructor_error(self):
+        class MyClass(object):
+            def __init__(self):
+                raise ValueError()
+
+        injector = Injector()
+        self.assertRaises(ValueError, injector.get_instance, MyClass)
+        assert not _CREATION_LOCKS._owners
+
+    def test_runtime_binding__circular(self):
+        class MyClass(object):
+            def __init__(self):
+                injector.get_instance(MyClass)
+
+        injector = Injector()
+        self.assertRaisesRegex(InjectorException, 'Circular dependency', injector.get_instance, MyClass)
+
+    def test_runtime_binding__circular_between_threads(self):
+        x_started = threading.Event()
+        y_started = threading.Event()
+        errors = []
+
+        class X(object):
+            def __init__(self):
+                x_started.set()
+                y_started.wait(1)
+                injector.get_instance(Y)
+
+        class Y(object):
+            def __init__(self):
+                y_started.set()
+                x_started.wait(1)
+                injector.get_instance(X)
+
+        def get_instance(cls):
+            try:
+                injector.get_instance(cls)
+            except InjectorException as e:
+                errors.append(e)
+
+        injector = Injector()
+        thread = threading.Thread(target=get_instance, args=(X,), daemon=True)
+        thread.start()
+        get_instance(Y)
+        thread.join(1)
+
+        assert not thread.is_alive()
+        assert len(errors) == 2
+        assert not _CREATION_LOCKS._owners
+
+    def test_injector__weakref_and_patch(self):
+        injector = Injector()
+        assert weakref.ref(injector)() is injector
+
+        with mock.patch.object(injector, 'get_instance', return_value=123):
+            assert injector.get_instance(int) == 123
+
     def test_runtime_binding__not_callable(self):
         injector = Injector()
         self.assertRaisesRegex(InjectorException,
@@ -1,7 +1,6 @@
 import inject
 from test import BaseTestInject
 import inspect
-import asyncio
 
 class TestInjectParams(BaseTestInject):
     def test_params(self):